@@ -1,6 +1,10 @@
 import os
+import re
 import sys
 import json
+import time
+import hashlib
+import functools
 import subprocess
 
 import tkinter as tk
@@ -9,9 +13,11 @@ from tkinter import ttk, filedialog, colorchooser, messagebox, simpledialog
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
 from io import BytesIO
 
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageDraw, ImageTk, ImageFont
 
 # ============================================================
@@ -23,6 +29,10 @@ CONFIG_FILE = "config.json"
 BASE_DIR = os.path.abspath(".")
 WEB_IMAGE_DIR = os.path.join(BASE_DIR, "web-images")
 WEB_LOGO_DIR = os.path.join(WEB_IMAGE_DIR, "logos")
+WEB_CACHE_DIR = os.path.join(WEB_IMAGE_DIR, "cache")
+
+# Refuse remote images larger than this (bytes)
+MAX_DOWNLOAD_BYTES = 50_000_000
 
 DEFAULT_CONFIG = {
     "output_dir": "output",
@@ -89,6 +99,17 @@ BACK_GAP = 30
 # UTIL
 # ============================================================
 
+# Single place to pick the resampling filter. Pillow-SIMD is a drop-in
+# replacement for Pillow that accelerates these same resize entry points,
+# so installing it speeds up every call site below with no code change.
+RESAMPLE = Image.Resampling.LANCZOS
+
+# A complete "#rrggbb" value; partial input while typing fails this
+HEX_COLOR_RE = re.compile(r"#[0-9a-fA-F]{6}$")
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".webp")
+
+
 def resource_path(relative_path):
     try:
         base_path = sys._MEIPASS
@@ -97,49 +118,155 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
-def load_image_from_file(path):
-    img = Image.open(path)
+def ensure_rgba(img):
     if img.mode != "RGBA":
         img = img.convert("RGBA")
     return img
 
 
+def load_image_from_file(path, target=None):
+    img = Image.open(path)
+    # Let the JPEG decoder downscale during decode when the consumer only
+    # needs target size anyway. No-op for PNG/WebP.
+    if target:
+        img.draft("RGB", target)
+    # Force the decode now so Pillow closes its file handle; otherwise
+    # the lazy image keeps the descriptor open for as long as the cache
+    # holds it.
+    img.load()
+    return ensure_rgba(img)
+
+
 def load_config():
-    if not os.path.exists(CONFIG_FILE):
+    try:
+        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
         save_config(DEFAULT_CONFIG)
         return DEFAULT_CONFIG.copy()
-    with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
 
 
 def save_config(cfg):
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+    # Write-then-rename so a crash mid-write can't leave a truncated
+    # config behind
+    tmp = CONFIG_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(cfg, f, indent=2)
+    os.replace(tmp, CONFIG_FILE)
+
+
+# One session for all artwork/API traffic so TLS connections to
+# SteamGridDB, TMDB and their CDNs are reused instead of re-negotiated
+# per request
+_session = requests.Session()
+_session.headers.update({"User-Agent": "Mozilla/5.0"})
+
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_image_cached(path, mtime, target):
+    return load_image_from_file(path, target=target)
+
+
+def load_image_cached(path, target=None):
+    """Memoized load_image_from_file keyed on (path, mtime).
+
+    Re-picking the same logo or poster skips the decode entirely; the
+    mtime in the key drops stale entries if the file changes on disk.
+    Callers must treat the returned image as read-only.
+    """
+    return _load_image_cached(path, os.path.getmtime(path), target)
+
+
+@functools.lru_cache(maxsize=32)
+def fetch_image_bytes(url, timeout=10):
+    """Download raw image bytes, caching them on disk keyed by URL hash.
+
+    Re-fetching the same poster/logo while tweaking colors or layout then
+    costs a local file read instead of a full TLS round-trip; the LRU on
+    top keeps the most recent payloads in memory so re-picking the same
+    URL within a session skips even the disk read.
+    """
+    cache_path = os.path.join(
+        WEB_CACHE_DIR,
+        hashlib.sha1(url.encode("utf-8")).hexdigest()
+    )
+
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            return f.read()
+
+    # stream=True defers the body, so oversized downloads can be refused
+    # from the Content-Length header before any pixels hit memory
+    response = _session.get(url, timeout=timeout, stream=True)
+    response.raise_for_status()
+
+    length = int(response.headers.get("Content-Length", 0))
+    if length > MAX_DOWNLOAD_BYTES:
+        raise ValueError(f"Remote image too large ({length} bytes)")
 
+    data = response.content
 
-def fit_image(img, max_w, max_h):
-    img = img.copy()
+    try:
+        os.makedirs(WEB_CACHE_DIR, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            f.write(data)
+    except OSError:
+        pass  # Cache is best-effort; the download still succeeded
+
+    return data
+
+
+@functools.lru_cache(maxsize=8)
+def get_font(size):
+    """Load the summary font once per size; falls back to the PIL default.
+
+    The lru_cache also remembers the fallback, so a missing arialbd.ttf
+    is probed once instead of raising on every render.
+    """
+    try:
+        return ImageFont.truetype("arialbd.ttf", size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=32)
+def solid_tile(w, h, color):
+    """Cached solid-color tile for the fixed-size panel fills.
+
+    Panel dimensions are constants, so each (size, color) pair is built
+    once; tiles for abandoned colors age out of the LRU naturally.
+    """
+    return Image.new("RGB", (w, h), color)
+
+
+def fit_image(img, max_w, max_h, resample=RESAMPLE):
     iw, ih = img.size
 
-    # Only shrink if bigger than max
+    # Only shrink if bigger than max; resize() already returns a new
+    # image, so the already-fits branch can hand back the original
     if iw > max_w or ih > max_h:
         scale = min(max_w / iw, max_h / ih)
         new_w = int(iw * scale)
         new_h = int(ih * scale)
-        img = img.resize((new_w, new_h), Image.LANCZOS)
+        # reducing_gap pre-shrinks big sources with a cheap box reduce
+        # before the Lanczos convolution runs
+        img = img.resize((new_w, new_h), resample, reducing_gap=2.0)
 
     return img
 
 
 def fit_image_upscale_only(img, max_w, max_h):
-    img = img.copy()
     iw, ih = img.size
 
     if iw < max_w and ih < max_h:
         scale = min(max_w / iw, max_h / ih)
         new_w = int(iw * scale)
         new_h = int(ih * scale)
-        img = img.resize((new_w, new_h), Image.LANCZOS)
+        img = img.resize((new_w, new_h), RESAMPLE)
 
     return img
 
@@ -147,10 +274,20 @@ def fit_image_upscale_only(img, max_w, max_h):
 def fit_fill(img, w, h):
     iw, ih = img.size
     scale = max(w / iw, h / ih)
-    img = img.resize((int(iw * scale), int(ih * scale)), Image.LANCZOS)
-    left = (img.width - w) // 2
-    top = (img.height - h) // 2
-    return img.crop((left, top, left + w, top + h))
+
+    # Crop-and-resize in one pass: resize(box=...) samples only the
+    # centered source window, so no oversized intermediate is allocated
+    src_w = w / scale
+    src_h = h / scale
+    left = (iw - src_w) / 2
+    top = (ih - src_h) / 2
+
+    return img.resize(
+        (w, h),
+        RESAMPLE,
+        box=(left, top, left + src_w, top + src_h),
+        reducing_gap=2.0
+    )
 
 
 # ============================================================
@@ -171,22 +308,91 @@ class CassetteApp(tk.Tk):
 
         self.config_data = load_config()
 
+        # Only write the config back if migration actually added keys
+        config_migrated = False
+
         # Ensure colors section exists
         if "colors" not in self.config_data:
             self.config_data["colors"] = DEFAULT_CONFIG["colors"].copy()
+            config_migrated = True
 
         # Ensure all default color keys exist (migration-safe)
         for key, value in DEFAULT_CONFIG["colors"].items():
             if key not in self.config_data["colors"]:
                 self.config_data["colors"][key] = value
-
-        save_config(self.config_data)
+                config_migrated = True
 
         self.colors = {
             k: tuple(v)
             for k, v in self.config_data["colors"].items()
         }
 
+        # Base canvas template (back/spine/banner fills), rebuilt only
+        # when one of those colors changes
+        self._base_cache = None
+        self._base_cache_key = None
+
+        # Last full-size render plus the state key it was built from, so
+        # back-to-back renders of unchanged state are free
+        self._render_cache = None
+        self._render_cache_key = None
+
+        # Pending after() id used to coalesce bursts of preview updates
+        self._preview_job = None
+
+        # True while an after_idle render kickoff is queued; lets
+        # several same-event triggers collapse into one render
+        self._preview_idle_pending = False
+
+        # Last time the crop slider kicked off a render (throttle)
+        self._last_crop_render = 0.0
+
+        # (mode, offset) snapshot of the crop Tk variables, taken on
+        # the Tk thread so the render worker never touches Tk state;
+        # matches the variables' initial values in _build_ui
+        self._crop_state = ("center", 0)
+
+        # Logo-picker thumbnails keyed by path -> (mtime, PhotoImage)
+        self._logo_thumb_cache = {}
+
+        # Cached (folder, built_at, entries) index of the system logo
+        # pack, so repeated searches don't re-walk the tree
+        self._logo_index = None
+
+        # TMDB /images responses keyed by (id, media_type); posters and
+        # logos for one title come from the same endpoint
+        self._tmdb_images_cache = {}
+
+        # Tk-side preview image; kept as an attribute so Tk's reference
+        # can be dropped explicitly before each swap
+        self.tk_img = None
+
+        # Preview renders run on a single worker thread; the sequence
+        # number lets stale results be dropped when a newer one exists
+        self._render_executor = ThreadPoolExecutor(max_workers=1)
+        self._render_seq = 0
+
+        # URL imports download and decode off the Tk thread
+        self._net_executor = ThreadPoolExecutor(max_workers=2)
+
+        # Shared pool for grid thumbnails and prefetches; created once
+        # so reopening search windows doesn't respawn eight threads and
+        # the session's connections stay warm between grids
+        self._download_pool = ThreadPoolExecutor(max_workers=8)
+
+        # Fitted/rotated asset variants reused across renders, keyed by
+        # (source identity, target box, rotation)
+        self._fit_cache = {}
+
+        # Last rendered summary layer and its key (text, box, color)
+        self._summary_cache = None
+
+        # Cached (raw_path, checked_at, exists) for the output directory
+        self._outdir_cache = None
+
+        # Pending after() id used to coalesce config writes
+        self._config_save_job = None
+
         # NFC logo colors (migrate old configs safely)
         self.nfc_logo_colors = self.config_data.get(
             "nfc_logo",
@@ -194,6 +400,9 @@ class CassetteApp(tk.Tk):
         )
         if "nfc_logo" not in self.config_data:
             self.config_data["nfc_logo"] = self.nfc_logo_colors
+            config_migrated = True
+
+        if config_migrated:
             save_config(self.config_data)
 
         # Assets
@@ -213,11 +422,9 @@ class CassetteApp(tk.Tk):
 
         self.poster_orientation = "portrait"
 
-        # NFC logos
-        self.nfc_logos = {
-            "white": Image.open(resource_path("assets/nfc_logo_white.png")).convert("RGBA"),
-            "black": Image.open(resource_path("assets/nfc_logo_black.png")).convert("RGBA")
-        }
+        # NFC logo variants are decoded and prebaked lazily on first
+        # render, keeping PNG decode off the cold startup path
+        self._nfc_variants = None
 
         self._build_ui()
         self.update_crop_visibility()
@@ -225,55 +432,89 @@ class CassetteApp(tk.Tk):
         self.update_output_button_state()
         self.update_search_menu_states()
 
-    def load_asset_file(self, key):
-        path = filedialog.askopenfilename(
-            filetypes=[("Images", "*.png *.jpg *.jpeg *.webp")]
-        )
-        if not path:
-            return
-
-        try:
-            img = Image.open(path)
-
-            if img.mode != "RGBA":
-                img = img.convert("RGBA")
-
-            self.assets[key] = img
-            self.update_preview()
-
-            if key == "poster":
-                self.update_crop_visibility()
-                self.update_poster_orientation()
+        # Flush any debounced config write before the window goes away
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        # The 500 ms save debounce means a change made just before
+        # closing may still be pending; write it out now rather than
+        # losing it with the event loop
+        if self._config_save_job is not None:
+            self.after_cancel(self._config_save_job)
+            self._flush_config()
+        self.destroy()
+
+    def _import_image(self, source, on_ready, target=None):
+        """Shared file/URL import behind every asset loader.
+
+        Calls on_ready(image, url) on the Tk thread — url is None for
+        file imports. File imports complete synchronously; URL imports
+        download and decode on a worker thread so the UI stays
+        responsive, then marshal the result back via after(). Errors
+        surface in a dialog here; cancelling never calls on_ready.
+        """
+        if source == "file":
+            path = filedialog.askopenfilename(
+                filetypes=[("Images", "*.png *.jpg *.jpeg *.webp")]
+            )
+            if not path:
+                return
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load image:\n{e}")
+            try:
+                on_ready(load_image_cached(path, target=target), None)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load image:\n{e}")
+            return
 
-    def load_asset_url(self, key):
         url = self.ask_url()
         if not url:
             return
 
-        # STEP 5 INSERTED HERE
         if not url.startswith(("http://", "https://")):
             messagebox.showerror("Error", "Invalid URL")
             return
 
+        self.config(cursor="watch")
+
+        def work():
+            try:
+                img = Image.open(BytesIO(fetch_image_bytes(url)))
+                if target:
+                    img.draft("RGB", target)
+                # Decode here on the worker, not lazily on the Tk
+                # thread, and let the byte buffer go with it
+                img.load()
+                img = ensure_rgba(img)
+            except Exception as e:
+                self.after(0, self._finish_import, None, url, on_ready, e)
+                return
+
+            self.after(0, self._finish_import, img, url, on_ready, None)
+
+        self._net_executor.submit(work)
+
+    def _finish_import(self, img, url, on_ready, error):
+        self.config(cursor="")
+
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to load image:\n{error}")
+            return
+
         try:
-            self.config(cursor="watch")
-            self.update()
+            on_ready(img, url)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load image:\n{e}")
 
-            response = requests.get(
-                url,
-                timeout=10,
-                headers={"User-Agent": "Mozilla/5.0"}
-            )
-            response.raise_for_status()
+    def load_asset_file(self, key):
+        self._load_asset(key, "file")
 
-            img = Image.open(BytesIO(response.content))
+    def load_asset_url(self, key):
+        self._load_asset(key, "url")
 
-            if img.mode != "RGBA":
-                img = img.convert("RGBA")
+    def _load_asset(self, key, source):
+        target = (FRONT_W, POSTER_H) if key == "poster" else None
 
+        def apply(img, url):
             self.assets[key] = img
             self.update_preview()
 
@@ -281,11 +522,7 @@ class CassetteApp(tk.Tk):
                 self.update_crop_visibility()
                 self.update_poster_orientation()
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load image:\n{e}")
-
-        finally:
-            self.config(cursor="")
+        self._import_image(source, apply, target=target)
 
     # ========================================================
     # UI
@@ -322,16 +559,20 @@ class CassetteApp(tk.Tk):
                 if not value.startswith("#"):
                     value = "#" + value
 
-                try:
-                    rgb = self._hex_to_rgb(value)
-                    self.colors[k] = rgb
-                    self.config_data.setdefault("colors", {})[k] = list(rgb)
-                    save_config(self.config_data)
+                # Ignore incomplete hex while typing instead of
+                # raising and catching ValueError per character
+                if not HEX_COLOR_RE.match(value):
+                    return
 
-                    box.config(background=value)
-                    self.update_preview()
-                except ValueError:
-                    pass  # Ignore invalid hex while typing
+                rgb = self._hex_to_rgb(value)
+                self.colors[k] = rgb
+                self.config_data.setdefault("colors", {})[k] = list(rgb)
+                self.schedule_config_save()
+
+                box.config(background=value)
+                # Typing "#1a2b3c" fires this trace per character;
+                # render once after the burst like the summary does
+                self.schedule_preview()
 
             hex_var.trace_add("write", update_color)
 
@@ -344,7 +585,7 @@ class CassetteApp(tk.Tk):
 
                     self.colors[k] = rgb
                     self.config_data.setdefault("colors", {})[k] = list(rgb)
-                    save_config(self.config_data)
+                    self.schedule_config_save()
 
                     var.set(hex_value)
                     box.config(background=hex_value)
@@ -370,22 +611,23 @@ class CassetteApp(tk.Tk):
         )
         self.summary_text.pack()
 
-        def update_summary(*_):
-            self.assets["summary"] = self.summary_text.get("1.0", "end").strip()
-            self.update_preview()
-
         def on_summary_change(event=None):
+            # <<Modified>> only fires when the buffer actually changed
+            # (one event per edit, none for plain cursor movement);
+            # resetting the flag re-arms it for the next edit
+            if not self.summary_text.edit_modified():
+                return
+            self.summary_text.edit_modified(False)
+
             self.assets["summary"] = self.summary_text.get("1.0", "end-1c")
-            self.update_preview()
+            self.schedule_preview()
 
-        self.summary_text.bind("<KeyRelease>", on_summary_change)
-        self.summary_text.bind("<FocusOut>", on_summary_change)
-        self.summary_text.bind("<<Paste>>", on_summary_change)
+        self.summary_text.bind("<<Modified>>", on_summary_change)
 
         def set_nfc(side, color):
             self.nfc_logo_colors[side] = color
             self.config_data["nfc_logo"] = self.nfc_logo_colors
-            save_config(self.config_data)
+            self.schedule_config_save()
             self.update_preview()
 
         for side in ("front", "spine", "back"):
@@ -462,157 +704,108 @@ class CassetteApp(tk.Tk):
             menu_button.grid(row=1, column=i, padx=6, pady=6)
 
         # --------------------------------------------------
-        # TITLE LOGO (NESTED MENU LIKE SYSTEM LOGO)
+        # TITLE / SYSTEM LOGO (NESTED MENUS, TABLE-DRIVEN)
         # --------------------------------------------------
 
-        title_btn = ttk.Menubutton(
-            asset_frame,
-            text="Title Logo",
-            direction="below"
-        )
-
-        title_menu = tk.Menu(title_btn, tearoff=False)
+        def build_logo_menu(label, column, loader, search_label, search_cmd, sides):
+            """Build an All Sides + per-side override menu for a logo slot.
 
-        # ----- All Sides (Default) -----
-        title_all_menu = tk.Menu(title_menu, tearoff=False)
+            Returns the pieces the state-update helpers need: the top
+            menu, the All Sides submenu with its search entry index, and
+            the override submenus keyed by side (with cascade and search
+            indices).
+            """
+            btn = ttk.Menubutton(asset_frame, text=label, direction="below")
+            menu = tk.Menu(btn, tearoff=False)
 
-        title_all_menu.add_command(
-            label="Import from file",
-            command=lambda: self.load_title_logo("default", "file")
-        )
-
-        title_all_menu.add_command(
-            label="Import from URL",
-            command=lambda: self.load_title_logo("default", "url")
-        )
-        title_all_menu.add_separator()
-
-        title_all_menu.add_command(
-            label="Search...",
-            command=lambda: self.open_search_window("title_logo_default")
-        )
-        self.title_logo_all_search_index = title_all_menu.index("end")
-
-        self.title_logo_all_menu = title_all_menu
-
-        title_menu.add_cascade(label="All Sides", menu=title_all_menu)
-        title_menu.add_separator()
-
-        # ----- Overrides -----
-        self.title_logo_menu_indices = {}
-
-        self.title_logo_override_menus = {}
-
-        for side in ("spine", "back"):
-            sub = tk.Menu(title_menu, tearoff=False)
-
-            sub.add_command(
+            all_menu = tk.Menu(menu, tearoff=False)
+            all_menu.add_command(
                 label="Import from file",
-                command=lambda s=side: self.load_title_logo(s, "file")
+                command=lambda: loader("default", "file")
             )
-
-            sub.add_command(
+            all_menu.add_command(
                 label="Import from URL",
-                command=lambda s=side: self.load_title_logo(s, "url")
+                command=lambda: loader("default", "url")
             )
-
-            sub.add_separator()
-
-            sub.add_command(
-                label="Search...",
-                command=lambda s=side: self.open_search_window(f"title_logo_{s}")
+            all_menu.add_separator()
+            all_menu.add_command(
+                label=search_label,
+                command=lambda: search_cmd("default")
             )
+            all_search_index = all_menu.index("end")
 
-            # Store override menu reference
-            self.title_logo_override_menus[side] = sub
-
-            title_menu.add_cascade(
-                label=f"Override {side.capitalize()}",
-                menu=sub
-            )
+            menu.add_cascade(label="All Sides", menu=all_menu)
+            menu.add_separator()
 
-            self.title_logo_menu_indices[side] = title_menu.index("end")
+            override_menus = {}
+            override_indices = {}
+            override_search = {}
 
-        title_btn["menu"] = title_menu
-        self.title_logo_menu = title_menu
-        title_btn.grid(row=1, column=3, padx=6, pady=6)
-        self.update_override_states()
+            for side in sides:
+                sub = tk.Menu(menu, tearoff=False)
 
-        # --------------------------------------------------
-        # SYSTEM LOGO (SPECIAL NESTED MENU)
-        # --------------------------------------------------
-
-        system_btn = ttk.Menubutton(
-            asset_frame,
-            text="System Logo",
-            direction="below"
-        )
-
-        system_menu = tk.Menu(system_btn, tearoff=False)
+                sub.add_command(
+                    label="Import from file",
+                    command=lambda s=side: loader(s, "file")
+                )
+                sub.add_command(
+                    label="Import from URL",
+                    command=lambda s=side: loader(s, "url")
+                )
+                sub.add_separator()
+                sub.add_command(
+                    label=search_label,
+                    command=lambda s=side: search_cmd(s)
+                )
 
-        # ---------- ALL SIDES ----------
-        all_menu = tk.Menu(system_menu, tearoff=False)
+                override_menus[side] = sub
+                override_search[side] = (sub, sub.index("end"))
 
-        all_menu.add_command(
-            label="Import from file",
-            command=lambda: self.load_system_logo("default", "file")
+                menu.add_cascade(
+                    label=f"Override {side.capitalize()}",
+                    menu=sub
+                )
+                override_indices[side] = menu.index("end")
+
+            btn["menu"] = menu
+            btn.grid(row=1, column=column, padx=6, pady=6)
+
+            return menu, all_menu, all_search_index, override_menus, override_indices, override_search
+
+        (
+            self.title_logo_menu,
+            self.title_logo_all_menu,
+            self.title_logo_all_search_index,
+            self.title_logo_override_menus,
+            self.title_logo_menu_indices,
+            _,
+        ) = build_logo_menu(
+            "Title Logo",
+            3,
+            self.load_title_logo,
+            "Search...",
+            lambda t: self.open_search_window(
+                "title_logo_default" if t == "default" else f"title_logo_{t}"
+            ),
+            ("spine", "back"),
         )
 
-        all_menu.add_command(
-            label="Import from URL",
-            command=lambda: self.load_system_logo("default", "url")
-        )
-        all_menu.add_separator()
-        all_menu.add_command(
-            label="Search Folder...",
-            command=lambda: self.search_system_logo_folder("default")
+        (
+            self.system_logo_menu,
+            _,
+            self.system_search_default_index,
+            self.system_logo_override_menus,
+            _,
+            self.system_search_override_indices,
+        ) = build_logo_menu(
+            "System Logo",
+            4,
+            self.load_system_logo,
+            "Search Folder...",
+            self.search_system_logo_folder,
+            ("front", "spine", "back"),
         )
-        self.system_search_default_index = all_menu.index("end")
-
-        system_menu.add_cascade(label="All Sides", menu=all_menu)
-        system_menu.add_separator()
-
-        # ---------- OVERRIDES ----------
-
-        self.system_logo_override_menus = {}
-
-        for side in ("front", "spine", "back"):
-            sub = tk.Menu(system_menu, tearoff=False)
-
-            sub.add_command(
-                label="Import from file",
-                command=lambda s=side: self.load_system_logo(s, "file")
-            )
-
-            sub.add_command(
-                label="Import from URL",
-                command=lambda s=side: self.load_system_logo(s, "url")
-            )
-
-            sub.add_separator()
-
-            sub.add_command(
-                label="Search Folder...",
-                command=lambda s=side: self.search_system_logo_folder(s)
-            )
-
-            # Store reference
-            self.system_logo_override_menus[side] = sub
-
-            if not hasattr(self, "system_search_override_indices"):
-                self.system_search_override_indices = {}
-
-            self.system_search_override_indices[side] = (sub, sub.index("end"))
-
-            system_menu.add_cascade(
-                label=f"Override {side.capitalize()}",
-                menu=sub
-            )
-
-        system_btn["menu"] = system_menu
-        system_btn.grid(row=1, column=4, padx=6, pady=6)
 
-        self.system_logo_menu = system_menu
         self.update_override_states()
         self.update_system_folder_search_state()
 
@@ -667,7 +860,7 @@ class CassetteApp(tk.Tk):
             to=1000,
             orient="horizontal",
             variable=self.crop_offset_var,
-            command=lambda e: self.update_preview()
+            command=lambda e: self._on_crop_slider()
         )
 
         # --------------------------------------------------------
@@ -780,8 +973,10 @@ class CassetteApp(tk.Tk):
             if folder:
                 self.config_data["output_dir"] = folder
                 save_config(self.config_data)
-                win.destroy()
-                self.open_settings()
+                # Refresh the label in place; rebuilding the whole
+                # window just to show the new path is wasteful
+                output_path_label.config(text=resolve_path(folder))
+                self._outdir_cache = None
 
         ttk.Button(
             output_section,
@@ -822,8 +1017,7 @@ class CassetteApp(tk.Tk):
             if folder:
                 self.config_data["system_logo_dir"] = folder
                 save_config(self.config_data)
-                win.destroy()
-                self.open_settings()
+                system_path_label.config(text=resolve_path(folder))
 
         ttk.Button(
             system_section,
@@ -1004,15 +1198,172 @@ class CassetteApp(tk.Tk):
     # RENDERER
     # ========================================================
 
+    def _base_canvas(self):
+        key = (
+            self.colors["back"],
+            self.colors["spine"],
+            self.colors["banner"]
+        )
+
+        if self._base_cache is None or self._base_cache_key != key:
+            base = Image.new("RGB", (CARD_W, CARD_H), self.colors["back"])
+
+            # Spine background
+            base.paste(solid_tile(SPINE_W, CARD_H, self.colors["spine"]), (BACK_W, 0))
+
+            # Front banner
+            base.paste(solid_tile(CARD_W - FRONT_X, BANNER_H, self.colors["banner"]), (FRONT_X, 0))
+
+            self._base_cache = base
+            self._base_cache_key = key
+
+        return self._base_cache
+
+    def _cached_fit(self, img, max_w, max_h, rot=0):
+        """fit_image (optionally after rotation) memoized per source image.
+
+        The source is kept in the cache entry so a recycled id() from a
+        garbage-collected image can never alias a stale variant.
+        """
+        key = (id(img), max_w, max_h, rot)
+
+        hit = self._fit_cache.get(key)
+        if hit is not None and hit[0] is img:
+            return hit[1]
+
+        src = img.rotate(-rot, expand=True) if rot else img
+        fitted = fit_image(src, max_w, max_h)
+
+        if len(self._fit_cache) >= 32:
+            self._fit_cache.clear()
+        self._fit_cache[key] = (img, fitted)
+
+        return fitted
+
+    @property
+    def nfc_variants(self):
+        """NFC logos decoded and pre-fit for every color/placement slot.
+
+        Built on first render rather than in __init__ so window startup
+        does not pay for the PNG decodes; the result is the same
+        prebaked table afterwards.
+        """
+        if self._nfc_variants is None:
+            nfc_logos = {
+                "white": ensure_rgba(Image.open(resource_path("assets/nfc_logo_white.png"))),
+                "black": ensure_rgba(Image.open(resource_path("assets/nfc_logo_black.png")))
+            }
+
+            # Pre-fit (and pre-rotate, for the spine) every variant
+            # once; render() only pastes them afterwards
+            self._nfc_variants = {
+                color: {
+                    "front": fit_image(logo, *NFC_FRONT_MAX),
+                    "spine": fit_image(logo, *NFC_SPINE_MAX).rotate(-90, expand=True),
+                    "back": fit_image(logo, *NFC_BACK_MAX),
+                }
+                for color, logo in nfc_logos.items()
+            }
+
+        return self._nfc_variants
+
+    def _summary_text_box(self, text, width, height):
+        """Wrapped summary text rendered onto its own RGBA layer, cached.
+
+        The layer only depends on the text, its box and the text color,
+        so color-square clicks and asset swaps reuse the previous one
+        instead of re-wrapping and re-rasterizing every glyph.
+        """
+        key = (text, width, height, self.colors["text"])
+
+        if self._summary_cache is not None and self._summary_cache[0] == key:
+            return self._summary_cache[1]
+
+        text_box = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        td = ImageDraw.Draw(text_box)
+
+        font = get_font(32)
+
+        # Wrapping engine: measure each word once and grow line widths
+        # incrementally instead of re-measuring the whole line prefix
+        # for every added word
+        space_w = font.getlength(" ")
+        word_widths = {}
+
+        lines = []
+
+        for raw_line in text.split("\n"):
+
+            # Preserve empty paragraphs
+            if raw_line.strip() == "":
+                lines.append("")  # blank line
+                continue
+
+            current_parts = []
+            current_w = 0.0
+
+            for word in raw_line.split(" "):
+                w = word_widths.get(word)
+                if w is None:
+                    w = font.getlength(word)
+                    word_widths[word] = w
+
+                test_w = current_w + (space_w + w if current_parts else w)
+
+                if test_w <= width:
+                    current_parts.append(word)
+                    current_w = test_w
+                else:
+                    if current_parts:
+                        lines.append(" ".join(current_parts))
+                    current_parts = [word]
+                    current_w = w
+
+            if current_parts:
+                lines.append(" ".join(current_parts))
+
+        # Exact line height from font
+        ascent, descent = font.getmetrics()
+        line_height = ascent + descent
+
+        y_offset = 0
+
+        for line in lines:
+
+            # Stop if next line would overflow
+            if y_offset >= height:
+                break
+
+            if line == "":
+                y_offset += line_height
+                continue
+
+            td.text((0, y_offset), line, fill=self.colors["text"], font=font)
+            y_offset += line_height
+
+        self._summary_cache = (key, text_box)
+
+        return text_box
+
+    def _render_key(self):
+        # Everything render() reads, condensed into a comparable key.
+        # Assets are keyed by object identity: load paths always assign
+        # fresh Image objects, so a swapped asset changes the key.
+        return (
+            tuple(sorted(self.colors.items())),
+            tuple(sorted(self.nfc_logo_colors.items())),
+            tuple((k, id(v)) for k, v in self.assets.items() if k != "summary"),
+            self.assets["summary"],
+            self._crop_state,
+        )
+
     def render(self):
-        img = Image.new("RGB", (CARD_W, CARD_H), self.colors["back"])
-        draw = ImageDraw.Draw(img)
+        key = self._render_key()
 
-        # Spine background
-        draw.rectangle((BACK_W, 0, BACK_W + SPINE_W, CARD_H), fill=self.colors["spine"])
+        if self._render_cache is not None and self._render_cache_key == key:
+            return self._render_cache
 
-        # Front banner
-        draw.rectangle((FRONT_X, 0, CARD_W, BANNER_H), fill=self.colors["banner"])
+        img = self._base_canvas().copy()
 
         # FRONT
         if self.assets["poster"]:
@@ -1022,17 +1373,14 @@ class CassetteApp(tk.Tk):
         logo = self.assets["system_logo_front"] or self.assets["system_logo_default"]
 
         if logo:
-            logo_img = fit_image(logo, *SYSTEM_LOGO_FRONT_MAX)
+            logo_img = self._cached_fit(logo, *SYSTEM_LOGO_FRONT_MAX)
             img.paste(
                 logo_img,
                 (FRONT_X + PADDING, (BANNER_H - logo_img.height) // 2),
                 logo_img
             )
         # NFC FRONT
-        nfc_front = fit_image(
-            self.nfc_logos[self.nfc_logo_colors["front"]],
-            *NFC_FRONT_MAX
-        )
+        nfc_front = self.nfc_variants[self.nfc_logo_colors["front"]]["front"]
 
         img.paste(
             nfc_front,
@@ -1043,8 +1391,7 @@ class CassetteApp(tk.Tk):
         logo = self.assets["system_logo_spine"] or self.assets["system_logo_default"]
 
         if logo:
-            rotated = logo.rotate(-90, expand=True)
-            sys_spine = fit_image(rotated, *SYSTEM_LOGO_SPINE_MAX)
+            sys_spine = self._cached_fit(logo, *SYSTEM_LOGO_SPINE_MAX, rot=90)
             img.paste(
                 sys_spine,
                 (BACK_W + (SPINE_W - sys_spine.width) // 2, NFC_MARGIN),
@@ -1054,8 +1401,7 @@ class CassetteApp(tk.Tk):
         title_spine = self.assets["title_logo_spine"] or self.assets["title_logo_default"]
 
         if title_spine:
-            rotated_logo = title_spine.rotate(-90, expand=True)
-            title_spine = fit_image(rotated_logo, *TITLE_LOGO_SPINE_MAX)
+            title_spine = self._cached_fit(title_spine, *TITLE_LOGO_SPINE_MAX, rot=90)
 
             img.paste(
                 title_spine,
@@ -1064,7 +1410,7 @@ class CassetteApp(tk.Tk):
                 title_spine
             )
 
-        nfc_spine = fit_image(self.nfc_logos[self.nfc_logo_colors["spine"]], *NFC_SPINE_MAX).rotate(-90, expand=True)
+        nfc_spine = self.nfc_variants[self.nfc_logo_colors["spine"]]["spine"]
         img.paste(
             nfc_spine,
             (
@@ -1081,26 +1427,23 @@ class CassetteApp(tk.Tk):
         # Pre-calc back logos (needed for summary height)
         # --------------------------------------------------
 
-        nfc_back = fit_image(
-            self.nfc_logos[self.nfc_logo_colors["back"]],
-            *NFC_BACK_MAX
-        )
+        nfc_back = self.nfc_variants[self.nfc_logo_colors["back"]]["back"]
 
         back_logo_asset = self.assets["system_logo_back"] or self.assets["system_logo_default"]
 
         sys_back = None
         if back_logo_asset:
-            sys_back = fit_image(back_logo_asset, *SYSTEM_LOGO_BACK_MAX)
+            sys_back = self._cached_fit(back_logo_asset, *SYSTEM_LOGO_BACK_MAX)
 
         title_back = self.assets["title_logo_back"] or self.assets["title_logo_default"]
 
         if title_back:
-            back_logo = fit_image(title_back, *TITLE_LOGO_BACK_MAX)
+            back_logo = self._cached_fit(title_back, *TITLE_LOGO_BACK_MAX)
             img.paste(back_logo, ((BACK_W - back_logo.width) // 2, y), back_logo)
             y += back_logo.height + BACK_GAP
 
         if self.assets["screenshot"]:
-            shot = fit_image(self.assets["screenshot"], *SCREENSHOT_MAX)
+            shot = self._cached_fit(self.assets["screenshot"], *SCREENSHOT_MAX)
             x_pos = (BACK_W - shot.width) // 2
             img.paste(shot, (x_pos, y))
             y += shot.height + BACK_GAP
@@ -1120,73 +1463,11 @@ class CassetteApp(tk.Tk):
             else:
                 text_width = BACK_W - 2 * PADDING
 
-            text_box = Image.new(
-                "RGBA",
-                (text_width, max_text_height),
-                (0, 0, 0, 0)
+            text_box = self._summary_text_box(
+                self.assets["summary"],
+                text_width,
+                max_text_height
             )
-            td = ImageDraw.Draw(text_box)
-
-            text = self.assets["summary"]
-
-            # Safe font loading
-            try:
-                font = ImageFont.truetype("arialbd.ttf", 32)
-            except:
-                font = ImageFont.load_default()
-
-            max_width = text_box.width
-            max_height = text_box.height
-
-            # Proper line height from font metrics
-            ascent, descent = font.getmetrics()
-            line_height = ascent + descent + 4
-
-            # Improved wrapping engine (preserves empty lines)
-            lines = []
-
-            for raw_line in text.split("\n"):
-
-                # Preserve empty paragraphs
-                if raw_line.strip() == "":
-                    lines.append("")  # blank line
-                    continue
-
-                words = raw_line.split(" ")
-                current = ""
-
-                for word in words:
-                    test = word if current == "" else current + " " + word
-                    width = font.getlength(test)
-
-                    if width <= max_width:
-                        current = test
-                    else:
-                        if current:
-                            lines.append(current)
-                        current = word
-
-                if current:
-                    lines.append(current)
-
-            # Exact line height from font
-            ascent, descent = font.getmetrics()
-            line_height = ascent + descent
-
-            y_offset = 0
-
-            for line in lines:
-
-                # Stop if next line would overflow
-                if y_offset >= max_height:
-                    break
-
-                if line == "":
-                    y_offset += line_height
-                    continue
-
-                td.text((0, y_offset), line, fill=self.colors["text"], font=font)
-                y_offset += line_height
 
             if self.assets["screenshot"]:
                 x_pos = (BACK_W - shot.width) // 2
@@ -1209,7 +1490,7 @@ class CassetteApp(tk.Tk):
 
         orig_y = None
         if original_cover:
-            original_img = fit_image(original_cover, *ORIGINAL_COVER_BACK_MAX)
+            original_img = self._cached_fit(original_cover, *ORIGINAL_COVER_BACK_MAX)
 
             if sys_back:
                 orig_y = sys_y - original_img.height - BACK_GAP
@@ -1237,30 +1518,143 @@ class CassetteApp(tk.Tk):
             nfc_back
         )
 
+        self._render_cache = img
+        self._render_cache_key = key
+
         return img
 
     # ========================================================
     # PREVIEW
     # ========================================================
 
+    def schedule_preview(self, delay=150):
+        """Coalesce a burst of preview requests into one redraw.
+
+        Typing in the summary fires one event per keystroke; rendering
+        once after the burst settles keeps the UI responsive.
+        """
+        if self._preview_job is not None:
+            self.after_cancel(self._preview_job)
+        self._preview_job = self.after(delay, self._run_scheduled_preview)
+
+    def _run_scheduled_preview(self):
+        self._preview_job = None
+        self.update_preview()
+
+    def schedule_config_save(self, delay=500):
+        """Coalesce a burst of config changes into one JSON write.
+
+        Typing a hex color fires one trace per character; persisting
+        once after the burst settles keeps the file consistent without
+        a disk write per keystroke.
+        """
+        if self._config_save_job is not None:
+            self.after_cancel(self._config_save_job)
+        self._config_save_job = self.after(delay, self._flush_config)
+
+    def _flush_config(self):
+        self._config_save_job = None
+        save_config(self.config_data)
+
     def update_preview(self):
-        img = self.render()
-        preview = img.resize((int(CARD_W * 0.35), int(CARD_H * 0.35)), Image.LANCZOS)
+        # Several handlers call this back to back for one user action
+        # (e.g. a poster load also updating crop state); collapse those
+        # into a single render per pass through the event loop
+        if self._preview_idle_pending:
+            return
+        self._preview_idle_pending = True
+        self.after_idle(self._start_preview_render)
+
+    def _snapshot_crop_state(self):
+        # Tk variables are only safe to read on the Tk thread, but
+        # render() runs on the worker executor; every render entry
+        # point snapshots them here first and render() reads the copy
+        self._crop_state = (
+            self.crop_mode_var.get(),
+            self.crop_offset_var.get(),
+        )
+
+    def _start_preview_render(self):
+        self._preview_idle_pending = False
+        self._render_seq += 1
+        seq = self._render_seq
+        self._snapshot_crop_state()
+
+        def work():
+            img = self.render()
+            # The on-screen preview is a throwaway ~570px thumbnail;
+            # BILINEAR plus the box pre-reduce is visually
+            # indistinguishable at that size and much cheaper than the
+            # export-quality filter
+            preview = img.resize(
+                (int(CARD_W * 0.35), int(CARD_H * 0.35)),
+                Image.Resampling.BILINEAR,
+                reducing_gap=2.0
+            )
+            self.after(0, lambda: self._apply_preview(seq, preview))
+
+        # PIL releases the GIL for the heavy work, so rendering off the
+        # Tk thread keeps the UI responsive on big posters
+        self._render_executor.submit(work)
+
+    def _apply_preview(self, seq, preview):
+        if seq != self._render_seq:
+            return  # A newer render is already in flight
+
+        # The preview size is fixed, so after the first frame we can
+        # paste new pixels into the existing Tcl image instead of
+        # allocating a PhotoImage per redraw (which also sidesteps the
+        # old-image leak this used to tear down by hand)
+        if (
+            self.tk_img is not None
+            and (self.tk_img.width(), self.tk_img.height()) == preview.size
+        ):
+            self.tk_img.paste(preview)
+            return
+
+        if self.tk_img is not None:
+            self.preview_label.configure(image="")
+            self.tk_img = None
+
         self.tk_img = ImageTk.PhotoImage(preview)
         self.preview_label.configure(image=self.tk_img)
 
     def _rgb_to_hex(self, rgb):
-        return "#{:02x}{:02x}{:02x}".format(*rgb)
+        r, g, b = rgb
+        # Mirror of _hex_to_rgb: one format op over a packed int
+        return "#%06x" % ((r << 16) | (g << 8) | b)
 
     def _hex_to_rgb(self, hex_color):
         hex_color = hex_color.lstrip("#")
         if len(hex_color) != 6:
             raise ValueError("Invalid hex")
-        return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+        # One int() parse plus shifts instead of three substring parses
+        v = int(hex_color, 16)
+        return ((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF)
+
+    def _output_dir_exists(self):
+        """Cached stat of the output directory (2 s TTL).
+
+        Button-state refreshes can then run freely without a syscall
+        each time; a changed path or an export that creates the folder
+        invalidates the entry.
+        """
+        raw = self.config_data.get("output_dir", "")
+        now = time.monotonic()
+
+        if (
+            self._outdir_cache is not None
+            and self._outdir_cache[0] == raw
+            and now - self._outdir_cache[1] < 2.0
+        ):
+            return self._outdir_cache[2]
+
+        exists = bool(raw) and os.path.exists(os.path.abspath(raw))
+        self._outdir_cache = (raw, now, exists)
+        return exists
 
     def update_output_button_state(self):
-        output_dir = self.config_data.get("output_dir", "")
-        if output_dir and os.path.exists(os.path.abspath(output_dir)):
+        if self._output_dir_exists():
             self.open_output_btn.config(state="normal")
         else:
             self.open_output_btn.config(state="disabled")
@@ -1301,48 +1695,51 @@ class CassetteApp(tk.Tk):
         # Determine orientation
         landscape = iw > ih
 
-        # Scale to fill
+        # Source window that fills the target box; handing it to
+        # resize(box=) crops and scales in one pass, so pixels outside
+        # the window are never resampled
         scale = max(target_w / iw, target_h / ih)
-        new_w = int(iw * scale)
-        new_h = int(ih * scale)
+        src_w = target_w / scale
+        src_h = target_h / scale
 
-        img = img.resize((new_w, new_h), Image.LANCZOS)
+        mode, offset = self._crop_state
 
-        mode = self.crop_mode_var.get()
+        if mode == "center":
+            frac = 0.5
+        elif mode == "top":  # means Left in landscape
+            frac = 0.0
+        elif mode == "bottom":  # means Right in landscape
+            frac = 1.0
+        else:  # manual
+            frac = offset / 1000
 
         if landscape:
             # Horizontal crop
-            overflow = new_w - target_w
-
-            if mode == "center":
-                left = overflow // 2
-            elif mode == "top":  # means Left in landscape
-                left = 0
-            elif mode == "bottom":  # means Right in landscape
-                left = overflow
-            else:  # manual
-                percent = self.crop_offset_var.get() / 1000
-                left = int(overflow * percent)
-
-            top = (new_h - target_h) // 2
-
+            left = (iw - src_w) * frac
+            top = (ih - src_h) / 2
         else:
             # Vertical crop
-            overflow = new_h - target_h
-
-            if mode == "center":
-                top = overflow // 2
-            elif mode == "top":
-                top = 0
-            elif mode == "bottom":
-                top = overflow
-            else:  # manual
-                percent = self.crop_offset_var.get() / 1000
-                top = int(overflow * percent)
-
-            left = (new_w - target_w) // 2
+            left = (iw - src_w) / 2
+            top = (ih - src_h) * frac
+
+        return img.resize(
+            (target_w, target_h),
+            RESAMPLE,
+            box=(left, top, left + src_w, top + src_h),
+            reducing_gap=2.0
+        )
 
-        return img.crop((left, top, left + target_w, top + target_h))
+    def _on_crop_slider(self):
+        # Dragging fires one event per pixel of motion. Render
+        # immediately when enough time has passed since the last
+        # kickoff, otherwise fall back to the debounce so the final
+        # slider position always gets a render.
+        now = time.monotonic()
+        if now - self._last_crop_render >= 0.05:
+            self._last_crop_render = now
+            self.update_preview()
+        else:
+            self.schedule_preview(50)
 
     def on_crop_mode_change(self):
         if self.crop_mode_var.get() == "manual":
@@ -1365,14 +1762,18 @@ class CassetteApp(tk.Tk):
 
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
+            self._outdir_cache = None
 
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         filename = f"cassette_cover_{timestamp}.png"
         full_path = os.path.join(output_dir, filename)
 
         try:
+            self._snapshot_crop_state()
             img = self.render()
-            img.save(full_path, "PNG")
+            # Low zlib effort: covers are mostly photographic, so heavier
+            # compression barely shrinks them but costs seconds per save
+            img.save(full_path, "PNG", optimize=False, compress_level=1)
             messagebox.showinfo("Export Complete", f"Saved to:\n{full_path}")
         except Exception as e:
             messagebox.showerror("Export Failed", str(e))
@@ -1388,8 +1789,9 @@ class CassetteApp(tk.Tk):
             return
 
         try:
+            self._snapshot_crop_state()
             img = self.render()
-            img.save(file_path, "PNG")
+            img.save(file_path, "PNG", optimize=False, compress_level=1)
             messagebox.showinfo("Export Complete", f"Saved to:\n{file_path}")
         except Exception as e:
             messagebox.showerror("Export Failed", str(e))
@@ -1411,9 +1813,11 @@ class CassetteApp(tk.Tk):
             if sys.platform.startswith("win"):
                 os.startfile(output_dir)
             elif sys.platform.startswith("darwin"):
-                subprocess.run(["open", output_dir])
+                # Fire and forget; run() would block the event loop
+                # until the file manager helper exits
+                subprocess.Popen(["open", output_dir], start_new_session=True)
             else:
-                subprocess.run(["xdg-open", output_dir])
+                subprocess.Popen(["xdg-open", output_dir], start_new_session=True)
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
@@ -1433,7 +1837,7 @@ class CassetteApp(tk.Tk):
         path = os.path.join(WEB_LOGO_DIR, name)
 
         try:
-            img = img.convert("RGBA")
+            img = ensure_rgba(img)
             img.save(path, format="PNG")
         except Exception as e:
             print("Failed to cache system logo:", e)
@@ -1444,29 +1848,8 @@ class CassetteApp(tk.Tk):
         if target != "default" and not self.assets["system_logo_default"]:
             return
 
-        try:
-            if source == "file":
-                path = filedialog.askopenfilename(
-                    filetypes=[("Images", "*.png *.jpg *.jpeg *.webp")]
-                )
-                if not path:
-                    return
-
-                img = load_image_from_file(path)
-
-            else:
-                url = self.ask_url()
-                if not url or not url.startswith(("http://", "https://")):
-                    return
-
-                response = requests.get(
-                    url,
-                    timeout=10,
-                    headers={"User-Agent": "Mozilla/5.0"}
-                )
-                response.raise_for_status()
-
-                img = Image.open(BytesIO(response.content)).convert("RGBA")
+        def apply(img, url):
+            if url:
                 img = self.maybe_cache_web_logo(img, url)
 
             key = "system_logo_default" if target == "default" else f"system_logo_{target}"
@@ -1482,33 +1865,13 @@ class CassetteApp(tk.Tk):
             self.update_override_states()
             self.update_preview()
 
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        self._import_image(source, apply)
 
     def load_title_logo(self, target, source):
         if target != "default" and not self.assets["title_logo_default"]:
             return
 
-        try:
-            if source == "file":
-                path = filedialog.askopenfilename(
-                    filetypes=[("Images", "*.png *.jpg *.jpeg *.webp")]
-                )
-                if not path:
-                    return
-                img = load_image_from_file(path)
-            else:
-                url = self.ask_url()
-                if not url or not url.startswith(("http://", "https://")):
-                    return
-                response = requests.get(
-                    url,
-                    timeout=10,
-                    headers={"User-Agent": "Mozilla/5.0"}
-                )
-                response.raise_for_status()
-                img = Image.open(BytesIO(response.content)).convert("RGBA")
-
+        def apply(img, url):
             key = "title_logo_default" if target == "default" else f"title_logo_{target}"
 
             # If setting new default, clear overrides
@@ -1522,8 +1885,7 @@ class CassetteApp(tk.Tk):
             self.update_search_menu_states()
             self.update_preview()
 
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        self._import_image(source, apply)
 
     def update_override_states(self):
 
@@ -1587,6 +1949,42 @@ class CassetteApp(tk.Tk):
                 except:
                     pass
 
+    def _system_logo_index(self, folder):
+        """Cached (lowercase name, path) listing of the logo pack.
+
+        Walking a multi-thousand-file pack per search is disk-bound;
+        the index is built once with os.scandir and reused for 10 s,
+        after which the next search rebuilds it to pick up new files.
+        """
+        now = time.monotonic()
+
+        if (
+            self._logo_index is not None
+            and self._logo_index[0] == folder
+            and now - self._logo_index[1] < 10.0
+        ):
+            return self._logo_index[2]
+
+        entries = []
+
+        def scan(d):
+            try:
+                with os.scandir(d) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            scan(entry.path)
+                        elif entry.is_file():
+                            name = entry.name.lower()
+                            if name.endswith(IMAGE_EXTS):
+                                entries.append((name, entry.path))
+            except OSError:
+                pass
+
+        scan(folder)
+
+        self._logo_index = (folder, now, entries)
+        return entries
+
     def search_system_logo_folder(self, target):
 
         folder = self.config_data.get("system_logo_dir", "")
@@ -1611,21 +2009,19 @@ class CassetteApp(tk.Tk):
         # ----------------------------------------
         # Scan filenames ONLY (fast)
         # ----------------------------------------
-        image_files = []
-
-        for root, dirs, files in os.walk(folder):
-            for f in files:
-                if f.lower().endswith((".png", ".jpg", ".jpeg", ".webp")):
-                    if query in f.lower():
-                        image_files.append(os.path.join(root, f))
+        image_files = [
+            path
+            for name, path in self._system_logo_index(folder)
+            if query in name
+        ]
 
         # Cached logos (optional)
         if self.config_data.get("search_cached_system_logos"):
             if os.path.isdir(WEB_LOGO_DIR):
                 for f in os.listdir(WEB_LOGO_DIR):
-                    if f.lower().endswith((".png", ".jpg", ".jpeg", ".webp")):
-                        if query in f.lower():
-                            image_files.append(os.path.join(WEB_LOGO_DIR, f))
+                    name = f.lower()
+                    if name.endswith(IMAGE_EXTS) and query in name:
+                        image_files.append(os.path.join(WEB_LOGO_DIR, f))
 
         if not image_files:
             messagebox.showinfo("No Results", "No matching system logos found.")
@@ -1679,15 +2075,28 @@ class CassetteApp(tk.Tk):
 
         for path in paths:
             try:
-                img = Image.open(path).convert("RGBA")
-                thumb = fit_image(img, 200, 200)
-                tk_img = ImageTk.PhotoImage(thumb)
+                # Reopening the picker re-shows mostly the same files;
+                # keep the finished PhotoImages keyed by (path, mtime)
+                # so only new or changed logos pay decode + fit
+                mtime = os.path.getmtime(path)
+                cached = self._logo_thumb_cache.get(path)
+
+                if cached is not None and cached[0] == mtime:
+                    tk_img = cached[1]
+                else:
+                    img = load_image_cached(path)
+                    thumb = fit_image(img, 200, 200)
+                    tk_img = ImageTk.PhotoImage(thumb)
+
+                    if len(self._logo_thumb_cache) >= 512:
+                        self._logo_thumb_cache.clear()
+                    self._logo_thumb_cache[path] = (mtime, tk_img)
 
                 lbl = tk.Label(frame, image=tk_img, cursor="hand2")
                 lbl.image = tk_img
 
                 def select_image(event, p=path):
-                    full_img = Image.open(p).convert("RGBA")
+                    full_img = load_image_cached(p)
 
                     key = "system_logo_default" if target == "default" else f"system_logo_{target}"
 
@@ -1879,7 +2288,7 @@ class CassetteApp(tk.Tk):
         results = []
 
         try:
-            r = requests.get(
+            r = _session.get(
                 f"https://www.steamgriddb.com/api/v2/search/autocomplete/{query}",
                 headers=headers,
                 timeout=10
@@ -1893,8 +2302,8 @@ class CassetteApp(tk.Tk):
                     "name": item["name"]
                 })
 
-        except:
-            pass
+        except (requests.RequestException, ValueError, KeyError) as e:
+            print("SteamGridDB search failed:", e)
 
         return results
 
@@ -1903,7 +2312,7 @@ class CassetteApp(tk.Tk):
         results = []
 
         try:
-            r = requests.get(
+            r = _session.get(
                 "https://api.themoviedb.org/3/search/multi",
                 params={"api_key": api_key, "query": query},
                 timeout=10
@@ -1929,8 +2338,8 @@ class CassetteApp(tk.Tk):
                     "media_type": media_type
                 })
 
-        except:
-            pass
+        except (requests.RequestException, ValueError, KeyError) as e:
+            print("TMDB search failed:", e)
 
         return results
 
@@ -1997,7 +2406,7 @@ class CassetteApp(tk.Tk):
         urls = []
 
         try:
-            grids = requests.get(
+            grids = _session.get(
                 f"https://www.steamgriddb.com/api/v2/grids/game/{game_id}?dimensions=600x900",
                 headers=headers,
                 timeout=10
@@ -2005,10 +2414,12 @@ class CassetteApp(tk.Tk):
             grids.raise_for_status()
 
             for g in grids.json().get("data", []):
-                urls.append(g["url"])
+                # (thumb, full): the grid shows the CDN's pre-shrunk
+                # thumbnail; the full asset is only fetched on click
+                urls.append((g.get("thumb", g["url"]), g["url"]))
 
-        except:
-            pass
+        except (requests.RequestException, ValueError, KeyError) as e:
+            print("SteamGridDB poster fetch failed:", e)
 
         return urls
 
@@ -2018,7 +2429,7 @@ class CassetteApp(tk.Tk):
         urls = []
 
         try:
-            r = requests.get(
+            r = _session.get(
                 f"https://www.steamgriddb.com/api/v2/logos/game/{game_id}",
                 headers=headers,
                 timeout=10
@@ -2026,26 +2437,42 @@ class CassetteApp(tk.Tk):
             r.raise_for_status()
 
             for item in r.json().get("data", [])[:20]:
-                urls.append(item["url"])
+                urls.append((item.get("thumb", item["url"]), item["url"]))
 
-        except:
-            pass
+        except (requests.RequestException, ValueError, KeyError) as e:
+            print("SteamGridDB logo fetch failed:", e)
 
         return urls
 
-    def fetch_tmdb_posters_by_id(self, tmdb_id, media_type="movie"):
+    def _tmdb_images(self, tmdb_id, media_type):
+        """Fetch (and cache) the TMDB /images payload for one title.
+
+        The endpoint returns posters and logos together; requesting a
+        poster grid and then a logo grid for the same title used to
+        cost two identical round-trips.
+        """
+        key = (tmdb_id, media_type)
+        cached = self._tmdb_images_cache.get(key)
+        if cached is not None:
+            return cached
+
         api_key = self.config_data["tmdb"]["api_key"]
+        r = _session.get(
+            f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/images",
+            params={"api_key": api_key},
+            timeout=10
+        )
+        r.raise_for_status()
+
+        data = r.json()
+        self._tmdb_images_cache[key] = data
+        return data
+
+    def fetch_tmdb_posters_by_id(self, tmdb_id, media_type="movie"):
         urls = []
 
         try:
-            r = requests.get(
-                f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/images",
-                params={"api_key": api_key},
-                timeout=10
-            )
-            r.raise_for_status()
-
-            posters = r.json().get("posters", [])
+            posters = self._tmdb_images(tmdb_id, media_type).get("posters", [])
 
             # Filter strictly English posters
             english_posters = [
@@ -2059,7 +2486,10 @@ class CassetteApp(tk.Tk):
 
             # NO LIMIT HERE
             for p in english_posters:
-                urls.append(f"https://image.tmdb.org/t/p/w500{p['file_path']}")
+                urls.append((
+                    f"https://image.tmdb.org/t/p/w342{p['file_path']}",
+                    f"https://image.tmdb.org/t/p/w500{p['file_path']}"
+                ))
 
         except Exception as e:
             print("TMDB poster fetch failed:", e)
@@ -2067,18 +2497,10 @@ class CassetteApp(tk.Tk):
         return urls
 
     def fetch_tmdb_logos_by_id(self, tmdb_id, media_type="movie"):
-        api_key = self.config_data["tmdb"]["api_key"]
         urls = []
 
         try:
-            r = requests.get(
-                f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/images",
-                params={"api_key": api_key, "include_image_language": "en,null"},
-                timeout=10
-            )
-            r.raise_for_status()
-
-            logos = r.json().get("logos", [])
+            logos = self._tmdb_images(tmdb_id, media_type).get("logos", [])
 
             english_logos = [
                 l for l in logos
@@ -2089,10 +2511,13 @@ class CassetteApp(tk.Tk):
                 english_logos = logos
 
             for logo in english_logos:
-                urls.append(f"https://image.tmdb.org/t/p/original{logo['file_path']}")
+                urls.append((
+                    f"https://image.tmdb.org/t/p/w500{logo['file_path']}",
+                    f"https://image.tmdb.org/t/p/original{logo['file_path']}"
+                ))
 
-        except:
-            pass
+        except (requests.RequestException, ValueError, KeyError) as e:
+            print("TMDB logo fetch failed:", e)
 
         return urls
 
@@ -2113,6 +2538,11 @@ class CassetteApp(tk.Tk):
 
         self._thumb_refs = []
 
+        # Hovering a cell starts the full-resolution download in the
+        # background, so by the time the user clicks it is usually
+        # already local; keyed by URL to dedupe repeat hovers
+        self._full_prefetch = {}
+
         canvas = tk.Canvas(win)
         scrollbar = ttk.Scrollbar(win, orient="vertical", command=canvas.yview)
 
@@ -2138,15 +2568,44 @@ class CassetteApp(tk.Tk):
 
         canvas.bind_all("<MouseWheel>", _on_mousewheel)
 
-        # Clean up binding when window closes
-        def _unbind_mousewheel():
+        # Clean up binding when window closes; also drop the Tcl
+        # thumbnails and prefetch futures so a closed grid doesn't keep
+        # a screenful of PhotoImages alive
+        def _close_grid():
             canvas.unbind_all("<MouseWheel>")
+            self._thumb_refs = []
+            self._full_prefetch = {}
+            win.destroy()
 
-        win.protocol("WM_DELETE_WINDOW", lambda: (_unbind_mousewheel(), win.destroy()))
+        win.protocol("WM_DELETE_WINDOW", _close_grid)
 
         loading_label = ttk.Label(frame, text="Loading posters...")
         loading_label.grid(row=0, column=0, padx=20, pady=20)
 
+        def fetch_thumb(thumb_url):
+            # fetch_image_bytes keeps these on disk keyed by URL hash,
+            # so reopening the same search costs file reads, not HTTP
+            img = Image.open(BytesIO(fetch_image_bytes(thumb_url)))
+            # Grid cells are 200x300; draft lets libjpeg decode the
+            # JPEG at a reduced scale instead of full resolution
+            img.draft("RGB", (200, 300))
+            # Keep opaque JPEGs as 3-byte RGB — padding them to RGBA
+            # only grows the buffer Tk has to copy. Modes that carry
+            # alpha (LA/PA, or palette PNGs with a tRNS chunk) go to
+            # RGBA so transparent logos keep their transparency.
+            if img.mode in ("LA", "PA") or (
+                img.mode == "P" and "transparency" in img.info
+            ):
+                img = img.convert("RGBA")
+            elif img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGB")
+            # Throwaway grid visuals: BILINEAR is indistinguishable at
+            # this size and much cheaper than the export-quality filter
+            return fit_image(
+                img, 200, 300,
+                resample=Image.Resampling.BILINEAR
+            )
+
         def load_images():
             if win.winfo_exists():
                 self.after(0, loading_label.destroy)
@@ -2157,15 +2616,17 @@ class CassetteApp(tk.Tk):
             col = 0
             cols = 4
 
-            for url in urls:
-                try:
-                    thumb_url = url.replace("w500", "w342")
-
-                    r = requests.get(thumb_url, timeout=10)
-                    r.raise_for_status()
+            # Download thumbnails in parallel on the shared pool;
+            # consuming the futures in submission order keeps the grid
+            # layout deterministic
+            futures = [
+                (full, self._download_pool.submit(fetch_thumb, thumb))
+                for thumb, full in urls
+            ]
 
-                    img = Image.open(BytesIO(r.content)).convert("RGBA")
-                    thumb = fit_image(img, 200, 300)
+            for url, future in futures:
+                try:
+                    thumb = future.result()
 
                     tk_img = ImageTk.PhotoImage(thumb)
                     self._thumb_refs.append(tk_img)
@@ -2182,13 +2643,26 @@ class CassetteApp(tk.Tk):
                         )
                         lbl.image = tk_img
 
-                        lbl.bind("<Enter>", lambda e: e.widget.config(relief="solid"))
+                        def on_enter(e):
+                            e.widget.config(relief="solid")
+                            if full_url not in self._full_prefetch:
+                                self._full_prefetch[full_url] = (
+                                    self._download_pool.submit(
+                                        fetch_image_bytes, full_url
+                                    )
+                                )
+
+                        lbl.bind("<Enter>", on_enter)
                         lbl.bind("<Leave>", lambda e: e.widget.config(relief="flat"))
 
                         def select_image(event):
-                            full_r = requests.get(full_url, timeout=10)
-                            full_r.raise_for_status()
-                            full_img = Image.open(BytesIO(full_r.content)).convert("RGBA")
+                            prefetched = self._full_prefetch.get(full_url)
+                            data = (
+                                prefetched.result()
+                                if prefetched is not None
+                                else fetch_image_bytes(full_url)
+                            )
+                            full_img = ensure_rgba(Image.open(BytesIO(data)))
 
                             self.assets[asset_key] = full_img
 
@@ -2205,7 +2679,7 @@ class CassetteApp(tk.Tk):
                                 self.update_poster_orientation()
 
                             self.update_preview()
-                            win.destroy()
+                            _close_grid()
 
                         lbl.bind("<Button-1>", select_image)
                         lbl.grid(row=row, column=col, padx=10, pady=10)
@@ -2220,59 +2694,15 @@ class CassetteApp(tk.Tk):
                     else:
                         return
 
-                except:
+                # ValueError covers the download size cap in
+                # fetch_image_bytes; one oversized poster should skip,
+                # not kill the whole grid thread
+                except (requests.RequestException, OSError, ValueError) as e:
+                    print("Thumbnail load failed:", e)
                     continue
 
         threading.Thread(target=load_images, daemon=True).start()
 
-    # ========================================================
-    # DISPLAY GRID
-    # ========================================================
-
-    def display_thumbnails(self, urls, container, asset_key, win):
-        cols = 4
-        row = 0
-        col = 0
-
-        for url in urls:
-            try:
-                thumb_url = url.replace("w500", "w342")
-
-                r = requests.get(thumb_url, timeout=10)
-                r.raise_for_status()
-
-                img = Image.open(BytesIO(r.content)).convert("RGBA")
-                thumb = fit_image(img, 200, 300)
-
-                tk_img = ImageTk.PhotoImage(thumb)
-
-                lbl = tk.Label(container, image=tk_img, cursor="hand2", bd=2, relief="flat")
-                lbl.image = tk_img
-                self._thumb_refs.append(tk_img)
-
-                lbl.bind("<Enter>", lambda e: e.widget.config(relief="solid"))
-                lbl.bind("<Leave>", lambda e: e.widget.config(relief="flat"))
-
-                def select_image(event, full_url=url):
-                    full_r = requests.get(full_url, timeout=10)
-                    full_r.raise_for_status()
-                    full_img = Image.open(BytesIO(full_r.content)).convert("RGBA")
-
-                    self.assets[asset_key] = full_img
-                    self.update_preview()
-                    win.destroy()
-
-                lbl.bind("<Button-1>", select_image)
-                lbl.grid(row=row, column=col, padx=10, pady=10)
-
-                col += 1
-                if col >= cols:
-                    col = 0
-                    row += 1
-
-            except:
-                continue
-
     # ========================================================
     # CUSTOM URL DIALOG
     # ========================================================